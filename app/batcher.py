@@ -0,0 +1,133 @@
+"""Micro-batching for LLM parse requests.
+
+Concurrent requests that arrive within a short window are coalesced into one
+multi-table completion, amortizing the provider round trip and the system
+prompt across the batch. Each waiter gets its own parsed table back.
+"""
+
+import asyncio
+import logging
+
+import orjson
+
+from .cache import LRUCache, text_key
+from .llm_client import GROQ_MODEL, create_completion, parse_table_with_llm
+
+BATCH_WINDOW = 0.010  # seconds to linger for more inputs after the first
+MAX_BATCH = 8
+
+BATCH_SYSTEM_PROMPT = """You are a strict table-extraction engine.
+The user message contains several numbered inputs, each a free-form
+description of tabular data. Output ONLY valid JSON with this shape:
+{"results": [{"id": 1, "columns": ["..."], "rows": [["...", ...], ...], "title": "..." or null}, ...]}
+Return one result object per input, with "id" matching the input number.
+Every row must have one value per column. Do not output markdown, comments or
+any text outside the JSON object.
+"""
+
+logger = logging.getLogger("tableparse")
+
+_queue: "asyncio.Queue[tuple[str, asyncio.Future]]" = asyncio.Queue()
+_worker_task = None
+_result_cache = LRUCache(maxsize=1024)
+# Fallback tasks must be referenced until done or the event loop may GC them
+# mid-flight.
+_fallback_tasks: set = set()
+
+
+def start():
+    """Start the background batch worker (idempotent; call on app startup,
+    restarts the worker if it ever died)."""
+    global _worker_task
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.get_running_loop().create_task(batch_worker())
+
+
+async def submit(text: str) -> dict:
+    """Queue ``text`` for the next batch and wait for its parsed table dict.
+
+    Inputs seen before are served from the dedupe cache without queueing.
+    """
+    key = text_key(text)
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return cached
+    fut = asyncio.get_running_loop().create_future()
+    await _queue.put((text, fut))
+    result = await fut
+    _result_cache.put(key, result)
+    return result
+
+
+async def batch_worker():
+    while True:
+        batch = [await _queue.get()]
+        while len(batch) < MAX_BATCH:
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout=BATCH_WINDOW))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _run_batch(batch)
+        except Exception as exc:
+            # The worker must outlive any single batch: if it died, every
+            # later submit() would hang on a future nobody resolves. Fail
+            # this batch's waiters and keep serving.
+            logger.exception("batch worker iteration failed")
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+
+async def _run_batch(batch):
+    if len(batch) == 1:
+        text, fut = batch[0]
+        await _resolve_single(text, fut)
+        return
+
+    numbered = "\n\n".join(f"Input {i + 1}:\n{text}" for i, (text, _) in enumerate(batch))
+    by_id = {}
+    try:
+        completion = await create_completion(
+            model=GROQ_MODEL,
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": numbered},
+            ],
+            temperature=0,
+            max_completion_tokens=256 * len(batch),
+            response_format={"type": "json_object"},
+        )
+        parsed = orjson.loads(completion.choices[0].message.content or "")
+        for result in parsed.get("results", []):
+            if isinstance(result, dict) and "columns" in result and "rows" in result:
+                by_id[result.get("id")] = result
+    except Exception:
+        by_id = {}
+
+    # Fan results back out; anything the batch reply missed (or a wholly
+    # unparseable reply) falls back to a per-item call. Waiters can vanish
+    # mid-batch (client disconnect cancels the future), so never resolve a
+    # future that is already done.
+    for i, (text, fut) in enumerate(batch):
+        result = by_id.get(i + 1)
+        if fut.done():
+            continue
+        if result is not None:
+            fut.set_result(result)
+        else:
+            task = asyncio.get_running_loop().create_task(_resolve_single(text, fut))
+            _fallback_tasks.add(task)
+            task.add_done_callback(_fallback_tasks.discard)
+
+
+async def _resolve_single(text, fut):
+    try:
+        raw = await parse_table_with_llm(text)
+        result = orjson.loads(raw)
+    except Exception as exc:
+        if not fut.done():
+            fut.set_exception(exc)
+        return
+    if not fut.done():
+        fut.set_result(result)
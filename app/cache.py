@@ -0,0 +1,32 @@
+"""Tiny in-process LRU used to dedupe identical LLM inputs.
+
+Good enough for a single-worker deployment; a multi-worker setup would swap
+this for a shared Redis keyed the same way.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+
+def text_key(text: str) -> str:
+    # blake2b is ~3x faster than sha256 on short strings.
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        try:
+            self._data.move_to_end(key)
+            return self._data[key]
+        except KeyError:
+            return None
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
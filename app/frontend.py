@@ -0,0 +1,46 @@
+import requests
+import streamlit as st
+
+API_URL = "http://localhost:8000/parse_and_render"
+
+
+@st.cache_resource
+def get_session():
+    """One keep-alive session for the whole app, so each click reuses the
+    backend connection instead of opening a new socket."""
+    s = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    s.mount("http://", adapter)
+    return s
+
+
+st.title("Table → Image")
+
+text = st.text_area("Describe your table", height=160)
+if st.button("Render"):
+    if not text.strip():
+        st.warning("Enter a description first.")
+    else:
+        resp = get_session().post(
+            API_URL, json={"text": text}, params={"width": 720}, timeout=60
+        )
+        if resp.ok:
+            st.session_state["rendered_text"] = text
+            st.session_state["rendered_png"] = resp.content
+        else:
+            st.session_state.pop("rendered_png", None)
+            st.error(f"Backend error {resp.status_code}: {resp.text}")
+
+if st.session_state.get("rendered_png"):
+    st.image(st.session_state["rendered_png"])
+    if st.button("Download full-res"):
+        full = get_session().post(
+            API_URL,
+            json={"text": st.session_state["rendered_text"]},
+            params={"width": 1600},
+            timeout=60,
+        )
+        if full.ok:
+            st.download_button("Save PNG", full.content, file_name="table.png", mime="image/png")
+        else:
+            st.error(f"Backend error {full.status_code}: {full.text}")
@@ -0,0 +1,67 @@
+import asyncio
+import itertools
+import os
+
+from groq import AsyncGroq, RateLimitError
+
+from .cache import LRUCache, text_key
+
+GROQ_MODEL = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")
+
+SYSTEM_PROMPT = """You are a strict table-extraction engine.
+Given a free-form description of tabular data, output ONLY valid JSON with this shape:
+{"columns": ["..."], "rows": [["...", ...], ...], "title": "..." or null}
+Every row must have one value per column. Do not output markdown, comments or
+any text outside the JSON object.
+"""
+
+# Module-level clients so the underlying httpx.AsyncClient keeps a pool of
+# keep-alive connections per key. GROQ_API_KEYS may hold a comma-separated
+# pool; Groq rate limits are per key, so effective RPM scales with key count.
+# With the variable unset we fall back to the single default-key client.
+_keys = [k.strip() for k in os.environ.get("GROQ_API_KEYS", "").split(",") if k.strip()]
+CLIENTS = [AsyncGroq(api_key=k) for k in _keys] or [AsyncGroq()]
+_idx = itertools.cycle(range(len(CLIENTS)))
+
+
+async def create_completion(**kwargs):
+    """Round-robin a completion across the client pool, hopping to the next
+    key with exponential backoff when one is rate limited."""
+    delay = 0.5
+    for attempt in range(3):
+        client = CLIENTS[next(_idx)]
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except RateLimitError:
+            if attempt == 2:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+
+
+_raw_cache = LRUCache(maxsize=1024)
+
+
+async def parse_table_with_llm(text: str) -> str:
+    """Ask the LLM to turn ``text`` into table JSON; returns the raw completion.
+
+    Identical inputs short-circuit to the cached raw output, skipping the
+    round trip entirely.
+    """
+    key = text_key(text)
+    cached = _raw_cache.get(key)
+    if cached is not None:
+        return cached
+    completion = await create_completion(
+        model=GROQ_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": text},
+        ],
+        temperature=0,
+        max_completion_tokens=256,
+        response_format={"type": "json_object"},
+    )
+    raw = completion.choices[0].message.content or ""
+    _raw_cache.put(key, raw)
+    return raw
@@ -0,0 +1,105 @@
+import asyncio
+import concurrent.futures
+import logging
+import logging.handlers
+import os
+import queue
+from typing import Optional
+
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+
+from . import batcher
+from .cache import LRUCache
+from .renderer import render_to_png_bytes
+from .routes import router
+from .schemas import ParseRequest, TableJSON
+
+# Handlers only enqueue records; a listener thread does the formatting and
+# stream I/O, so logging during error storms never blocks the event loop.
+_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Keep the enqueued record as the bare message; the listener side adds the
+# timestamp/level prefix.
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+
+app = FastAPI(title="ai-table-to-image", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.include_router(router)
+
+# CPU-bound rendering runs in worker processes so it neither blocks the event
+# loop nor contends on the GIL with other requests.
+RENDER_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+@app.on_event("startup")
+async def _start_batcher():
+    batcher.start()
+
+
+async def _parse_to_table(text: str) -> "tuple[list, list, Optional[str]]":
+    """Parse ``text`` with the LLM and return ``(columns, rows, title)`` as
+    plain lists, ready for either the response model or the renderer."""
+    try:
+        parsed = await batcher.submit(text)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=502, detail="LLM returned invalid JSON")
+    columns = parsed.get("columns") or []
+    # Pad ragged rows so every row matches the header width.
+    n_cols = len(columns)
+    rows = [list(row) + [""] * (n_cols - len(row)) for row in parsed.get("rows") or []]
+    return columns, rows, parsed.get("title")
+
+
+@app.post("/parse", response_model=TableJSON)
+async def parse_endpoint(payload: ParseRequest):
+    columns, rows, title = await _parse_to_table(payload.text)
+    return TableJSON.model_validate({"columns": columns, "rows": rows, "title": title})
+
+
+_png_cache = LRUCache(maxsize=256)
+
+
+async def _render_png(columns, rows, title, max_width=1200) -> bytes:
+    # Content-addressed: identical tables (double clicks, dedupe-cached LLM
+    # output) reuse the encoded PNG instead of re-rendering.
+    try:
+        key = (tuple(columns), tuple(tuple(r) for r in rows), title, max_width)
+        # Tuples build fine around list/dict cells; only hashing rejects them,
+        # so probe it here rather than crashing inside the cache lookup.
+        hash(key)
+    except TypeError:
+        key = None
+    if key is not None:
+        cached = _png_cache.get(key)
+        if cached is not None:
+            return cached
+    img_bytes = await asyncio.get_running_loop().run_in_executor(
+        RENDER_POOL, render_to_png_bytes, columns, rows, title, max_width
+    )
+    if key is not None:
+        _png_cache.put(key, img_bytes)
+    return img_bytes
+
+
+@app.post("/render")
+async def render_endpoint(table: TableJSON):
+    img_bytes = await _render_png(table.columns, table.rows, table.title)
+    return Response(content=img_bytes, media_type="image/png")
+
+
+@app.post("/parse_and_render")
+async def parse_and_render(payload: ParseRequest, width: int = 720):
+    # Render and encode cost scale with pixel count, and the frontend displays
+    # at ~700 px anyway; full resolution is one ?width=1600 away.
+    width = min(max(width, 320), 1600)
+    columns, rows, title = await _parse_to_table(payload.text)
+    img_bytes = await _render_png(columns, rows, title, max_width=width)
+    return Response(content=img_bytes, media_type="image/png")
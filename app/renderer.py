@@ -0,0 +1,203 @@
+import functools
+from io import BytesIO
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+CELL_PAD = 8
+LINE_WIDTH = 1
+MIN_COL_W = 60
+
+# Quantize to a 16-color palette before encoding. The tables only use a
+# handful of colors plus anti-aliased text edges, so 4-bit palette PNGs are a
+# fraction of the RGB size and cheaper to deflate; disable if text ever looks
+# chunky.
+PALETTE_PNG = True
+HEADER_BG = (235, 235, 235)
+
+TITLE_FONT_SIZE = 22
+HEADER_FONT_SIZE = 16
+DEFAULT_FONT_SIZE = 14
+
+
+def _load_font(size):
+    for name in ("DejaVuSans.ttf", "Arial.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+TITLE_FONT = _load_font(TITLE_FONT_SIZE)
+HEADER_FONT = _load_font(HEADER_FONT_SIZE)
+DEFAULT_FONT = _load_font(DEFAULT_FONT_SIZE)
+
+
+def _line_height(font):
+    bbox = font.getbbox("Ag")
+    return bbox[3] - bbox[1]
+
+
+# Line heights are constant per font; computing them once here removes one
+# FreeType call per wrapped line from the hot path.
+TITLE_LINE_H = _line_height(TITLE_FONT)
+HEADER_LINE_H = _line_height(HEADER_FONT)
+DEFAULT_LINE_H = _line_height(DEFAULT_FONT)
+
+_LINE_H = {TITLE_FONT: TITLE_LINE_H, HEADER_FONT: HEADER_LINE_H, DEFAULT_FONT: DEFAULT_LINE_H}
+
+
+@functools.lru_cache(maxsize=100_000)
+def _text_width(font, s):
+    """Memoized pixel width; font metric calls are expensive and tables repeat
+    the same words constantly."""
+    return font.getbbox(s)[2]
+
+
+def measure_text(text, font, max_width):
+    """Greedy word-wrap ``text`` to ``max_width`` pixels.
+
+    Returns ``(lines, height)`` where ``height`` is the total pixel height of
+    the wrapped block.
+    """
+    words = str(text).split()
+    line_h = _LINE_H.get(font) or _line_height(font)
+    if not words:
+        return [""], line_h
+    lines = []
+    current = words[0]
+    cur_w = _text_width(font, current)
+    for w in words[1:]:
+        # Measure only the increment instead of re-measuring the whole line.
+        add_w = _text_width(font, " " + w)
+        if cur_w + add_w <= max_width:
+            current += " " + w
+            cur_w += add_w
+        else:
+            lines.append(current)
+            current = w
+            cur_w = _text_width(font, w)
+    lines.append(current)
+    return lines, line_h * len(lines)
+
+
+def _column_widths(columns, rows, max_width):
+    """Distribute ``max_width`` across columns proportionally to their longest
+    cell, so short columns stop forcing long ones to wrap."""
+    n_cols = len(columns)
+    padded = [
+        [("" if c is None else str(c)) for c in (list(r) + [""] * (n_cols - len(r)))[:n_cols]]
+        for r in rows
+    ]
+    arr = np.array(padded or [[""] * n_cols], dtype=object)
+    lens = np.vectorize(len)(arr).max(axis=0)
+    lens = np.maximum(lens, [max(len(c), 1) for c in columns])
+    # The MIN_COL_W floor only holds if all columns fit at that floor; for
+    # very wide tables shrink it (down to 1 px) so widths stay positive.
+    min_w = max(min(MIN_COL_W, max_width // n_cols), 1)
+    widths = np.clip(lens / lens.sum() * max_width, min_w, None).astype(int)
+    # Walk the rounding/clipping drift off the widest columns without letting
+    # any column dip below the floor, so the total is exactly max_width.
+    drift = max_width - int(widths.sum())
+    if drift > 0:
+        widths[np.argmax(widths)] += drift
+    else:
+        for i in np.argsort(widths)[::-1]:
+            if drift == 0:
+                break
+            give = min(-drift, int(widths[i]) - min_w)
+            widths[i] -= give
+            drift += give
+    return widths
+
+
+def render_table_image(columns, rows, title=None, max_width=1200):
+    """Draw ``columns``/``rows`` as a grid and return a PIL image."""
+    columns = [("" if c is None else str(c)) for c in (columns or [""])]
+    n_cols = len(columns)
+    col_widths = _column_widths(columns, rows, max_width)
+    x_edges = np.concatenate(([0], np.cumsum(col_widths)))
+
+    title_h = 0
+    if title:
+        _, th = measure_text(title, TITLE_FONT, max_width - 2 * CELL_PAD)
+        title_h = th + 2 * CELL_PAD
+    header_cells = [
+        measure_text(c, HEADER_FONT, col_widths[ci] - 2 * CELL_PAD)
+        for ci, c in enumerate(columns)
+    ]
+    header_h = max(h for _, h in header_cells) + 2 * CELL_PAD
+
+    row_cells = []
+    row_heights = []
+    for r in rows:
+        cells = []
+        for ci in range(n_cols):
+            val = r[ci] if ci < len(r) else ""
+            cells.append(
+                measure_text("" if val is None else val, DEFAULT_FONT, col_widths[ci] - 2 * CELL_PAD)
+            )
+        row_cells.append(cells)
+        row_heights.append(max(h for _, h in cells) + 2 * CELL_PAD)
+
+    width = int(x_edges[-1]) + LINE_WIDTH
+    height = title_h + header_h + sum(row_heights) + LINE_WIDTH
+    grid_top = title_h
+    y_edges = [grid_top, grid_top + header_h]
+    for rh in row_heights:
+        y_edges.append(y_edges[-1] + rh)
+
+    # Paint the background, header band and every gridline as NumPy slice
+    # fills: two band assignments per boundary instead of one draw call per
+    # cell border.
+    img_np = np.full((height, width, 3), 255, dtype=np.uint8)
+    img_np[grid_top : grid_top + header_h] = HEADER_BG
+    for yy in y_edges:
+        img_np[yy : yy + LINE_WIDTH, :] = 0
+    for xx in x_edges:
+        img_np[grid_top:, int(xx) : int(xx) + LINE_WIDTH] = 0
+    img = Image.fromarray(img_np)
+    draw = ImageDraw.Draw(img)
+
+    y = 0
+    if title:
+        draw.text((CELL_PAD, y + CELL_PAD), str(title), font=TITLE_FONT, fill="black")
+        y += title_h
+
+    for ci, (lines, _) in enumerate(header_cells):
+        x = int(x_edges[ci])
+        line_y = y + CELL_PAD
+        for ln in lines:
+            draw.text((x + CELL_PAD, line_y), ln, font=HEADER_FONT, fill="black")
+            line_y += HEADER_LINE_H
+    y += header_h
+
+    for cells, rh in zip(row_cells, row_heights):
+        for ci, (lines, _) in enumerate(cells):
+            x = int(x_edges[ci])
+            line_y = y + CELL_PAD
+            for ln in lines:
+                draw.text((x + CELL_PAD, line_y), ln, font=DEFAULT_FONT, fill="black")
+                line_y += DEFAULT_LINE_H
+        y += rh
+
+    return img
+
+
+def render_to_png_bytes(columns, rows, title=None, max_width=1200):
+    """Render and encode in one call; returns the PNG bytes.
+
+    Top-level so it is picklable for the render process pool, and returning
+    bytes avoids shipping a PIL Image across the process boundary.
+    """
+    img = render_table_image(columns, rows, title=title, max_width=max_width)
+    buf = BytesIO()
+    # PNG encode time is dominated by zlib; level 1 is ~3-5x faster than the
+    # default 6 on these flat-color grids for a modest size cost.
+    if PALETTE_PNG:
+        img = img.convert("P", palette=Image.ADAPTIVE, colors=16)
+        img.save(buf, format="PNG", optimize=False, compress_level=1, bits=4)
+    else:
+        img.save(buf, format="PNG", optimize=False, compress_level=1)
+    return buf.getvalue()
@@ -0,0 +1,63 @@
+import logging
+
+from fastapi import APIRouter, HTTPException
+
+from .cache import LRUCache, text_key
+from .llm_client import GROQ_MODEL, create_completion
+from .schemas import ParseRequest
+
+router = APIRouter()
+
+logger = logging.getLogger("tableparse")
+
+_raw_cache = LRUCache(maxsize=1024)
+
+# Input tokens drive prefill latency and cost; the short schema-only prompt is
+# enough for most inputs, so the few-shot example is only attached when the
+# input looks like a multi-line / sparse table where it actually helps.
+_SYSTEM_PROMPT_SHORT = """You are a strict table-extraction engine.
+Given a free-form description of tabular data, output ONLY valid JSON with this shape:
+{"columns": ["..."], "rows": [["...", ...], ...], "title": "..." or null}
+
+Rules:
+- Every row must have exactly one value per column.
+- Use "" for missing values, never null.
+- Keep numbers as they appear in the input (do not convert units).
+- Do not output markdown, comments or any text outside the JSON object.
+"""
+
+_SYSTEM_PROMPT_FEWSHOT = _SYSTEM_PROMPT_SHORT + """
+Example:
+Input: "Revenue was 10M in 2022, 14M in 2023 and 21M in 2024. Profit was 1M, NA and 3M."
+Output: {"columns": ["Year", "Revenue", "Profit"], "rows": [["2022", "10M", "1M"], ["2023", "14M", "NA"], ["2024", "21M", "3M"]], "title": "Revenue and profit by year"}
+"""
+
+
+@router.post("/parse_table")
+async def parse_table(payload: ParseRequest):
+    """Raw parse endpoint: returns the LLM output as-is for clients that do
+    their own JSON salvage (the Streamlit app)."""
+    key = text_key(payload.text)
+    cached = _raw_cache.get(key)
+    if cached is not None:
+        return {"raw": cached}
+    text = payload.text
+    use_fewshot = "\n" in text and any(x in text for x in ("—", "–", "NA"))
+    system_prompt = _SYSTEM_PROMPT_FEWSHOT if use_fewshot else _SYSTEM_PROMPT_SHORT
+    try:
+        completion = await create_completion(
+            model=GROQ_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            temperature=0,
+            max_completion_tokens=256,
+            response_format={"type": "json_object"},
+        )
+        raw = completion.choices[0].message.content or ""
+        _raw_cache.put(key, raw)
+        return {"raw": raw}
+    except Exception:
+        logger.exception("parse_table failed")
+        raise HTTPException(status_code=502, detail="LLM request failed")
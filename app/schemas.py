@@ -0,0 +1,16 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ParseRequest(BaseModel):
+    text: str
+
+
+class TableJSON(BaseModel):
+    # The LLM occasionally invents extra keys; drop them instead of erroring.
+    model_config = ConfigDict(extra="ignore")
+
+    columns: List[str]
+    rows: List[List[Any]]
+    title: Optional[str] = None
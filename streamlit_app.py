@@ -0,0 +1,105 @@
+import json
+
+import requests
+import streamlit as st
+
+API_URL = "http://localhost:8000/parse_table"
+
+
+@st.cache_resource
+def _libs():
+    """pandas and plotly dominate cold-start import time; defer them until a
+    table is actually displayed."""
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    return pd, px, go
+
+
+def try_parse_json(raw):
+    """The LLM sometimes wraps the JSON in prose; salvage the object if we can."""
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        start = raw.find("{")
+        end = raw.rfind("}")
+        if start != -1 and end > start:
+            return json.loads(raw[start : end + 1])
+        raise
+
+
+def parsed_to_df(parsed):
+    pd, _, _ = _libs()
+    columns = parsed.get("columns", [])
+    rows = parsed.get("rows", [])
+    fixed = [list(r[: len(columns)]) + [""] * (len(columns) - len(r)) for r in rows]
+    return pd.DataFrame(fixed, columns=columns)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def call_llm(text):
+    """LLM round trip, cached on the input text so reruns (chart switching,
+    widget changes) don't re-hit the API for the same description."""
+    return requests.post(API_URL, json={"text": text}, timeout=60).json()["raw"]
+
+
+@st.cache_data
+def make_df(raw):
+    return parsed_to_df(try_parse_json(raw))
+
+
+def _hash_df(df):
+    pd, _, _ = _libs()
+    return pd.util.hash_pandas_object(df).values.tobytes()
+
+
+_DF_HASH = {"pandas.core.frame.DataFrame": _hash_df}
+
+
+# Not cached: st.cache_data pickles return values and a Styler isn't
+# picklable; styling is cheap anyway since the LLM/DataFrame steps above
+# carry the cost.
+def style_pandas(df):
+    return df.style.set_properties(**{"text-align": "left"}).set_table_styles(
+        [{"selector": "th", "props": [("background-color", "#ebebeb")]}]
+    )
+
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def plotly_table_from_df(df):
+    _, _, go = _libs()
+    return go.Figure(
+        data=[
+            go.Table(
+                header=dict(values=list(df.columns), fill_color="#ebebeb", align="left"),
+                cells=dict(values=[df[c] for c in df.columns], align="left"),
+            )
+        ]
+    )
+
+
+st.title("AI Table Builder")
+
+text = st.text_area("Paste a description of your data", height=160)
+view = st.radio("View", ["Styled table", "Plotly table", "Bar chart"], horizontal=True)
+
+if st.button("Parse"):
+    st.session_state["parse_text"] = text
+
+if st.session_state.get("parse_text", "").strip():
+    raw = call_llm(st.session_state["parse_text"])
+    df = make_df(raw)
+
+    if view == "Styled table":
+        st.dataframe(style_pandas(df))
+    elif view == "Plotly table":
+        st.plotly_chart(plotly_table_from_df(df))
+    else:
+        pd, px, _ = _libs()
+        numeric = df.apply(pd.to_numeric, errors="coerce")
+        ycols = [c for c in df.columns[1:] if numeric[c].notna().any()]
+        if ycols:
+            st.plotly_chart(px.bar(df, x=df.columns[0], y=ycols))
+        else:
+            st.info("No numeric columns to chart.")